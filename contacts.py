@@ -0,0 +1,221 @@
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+# Compiled once at import so validation is a single C-level match call.
+_PHONE_RE = re.compile(r'\A\d{10}\Z', re.ASCII)
+
+# Above this many records, show-all streams into a StringIO buffer
+# instead of materializing every per-record string in a list first.
+SHOW_ALL_BUFFER_THRESHOLD = 1000
+
+# Optional JIT path for scanning very large books; the pure-Python bisect
+# path below is used whenever numba/numpy are not installed.
+try:
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+    _njit = None
+
+if _njit is not None:
+    @_njit(cache=True)
+    def _scan_bday_keys(keys, lo, hi, wrap):
+        out = _np.empty(keys.shape[0], _np.int32)
+        n = 0
+        for i in range(keys.shape[0]):
+            k = keys[i]
+            if wrap:
+                hit = k >= lo or k <= hi
+            else:
+                hit = lo <= k <= hi
+            if hit:
+                out[n] = i
+                n += 1
+        return out[:n]
+
+def _presized_dict(capacity):
+    # CPython keeps a dict's grown hash table when keys are deleted one by
+    # one (unlike .clear()), so filling and emptying a dict pre-sizes it.
+    presized = dict.fromkeys(range(capacity))
+    for key in range(capacity):
+        del presized[key]
+    return presized
+
+class Field:
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return str(self.value)
+
+class Phone(Field):
+    __slots__ = ()
+
+    def __init__(self, value):
+        if not self._validate_phone(value):
+            raise ValueError("Phone number must contain exactly 10 digits.")
+        super().__init__(value)
+
+    @staticmethod
+    def _validate_phone(value):
+        return _PHONE_RE.match(value) is not None
+
+class Birthday(Field):
+    __slots__ = ('text', 'month', 'day', 'md_key')
+
+    def __init__(self, value):
+        try:
+            self.value = datetime.strptime(value, "%d.%m.%Y").date()
+        except ValueError:
+            raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        # Formatted once here; Birthday is immutable so every display site
+        # can reuse the cached string instead of calling strftime again.
+        self.text = self.value.strftime("%d.%m.%Y")
+        self.month = self.value.month
+        self.day = self.value.day
+        # Single int encoding of (month, day) so birthday scans can compare
+        # plain integers instead of building datetime objects per record.
+        self.md_key = self.month * 32 + self.day
+
+class Record:
+    __slots__ = ('name', 'phones', 'birthday', '_book', '_str_cache')
+
+    def __init__(self, name, phone_capacity=0):
+        if not name:
+            raise ValueError("Name cannot be empty.")
+        # Kept as a plain string: the Field wrapper added an extra object
+        # and attribute hop per contact without adding behaviour.
+        self.name = name
+        self.phones = _presized_dict(phone_capacity) if phone_capacity else {}
+        self.birthday = None
+        self._book = None
+        self._str_cache = None
+
+    def add_phone(self, phone):
+        new_phone = Phone(phone)
+        self.phones[new_phone.value] = new_phone
+        self._str_cache = None
+
+    def remove_phone(self, phone):
+        self.phones.pop(phone, None)
+        self._str_cache = None
+
+    def edit_phone(self, old_phone, new_phone):
+        if old_phone in self.phones:
+            # Validate the replacement first so an invalid new number
+            # leaves the record (and its cached string) untouched.
+            replacement = Phone(new_phone)
+            del self.phones[old_phone]
+            self.phones[replacement.value] = replacement
+            self._str_cache = None
+
+    def find_phone(self, phone):
+        return self.phones.get(phone, None)
+
+    def add_birthday(self, birthday):
+        self.birthday = Birthday(birthday)
+        self._str_cache = None
+        if self._book is not None:
+            self._book._bday_index_dirty = True
+
+    def days_to_birthday(self):
+        if self.birthday:
+            today = date.today()
+            next_birthday = self.birthday.value.replace(year=today.year)
+            if next_birthday < today:
+                next_birthday = self.birthday.value.replace(year=today.year + 1)
+            # Ordinal subtraction gives the day count without allocating an
+            # intermediate timedelta.
+            return next_birthday.toordinal() - today.toordinal()
+        return None
+
+    def __str__(self):
+        # Rebuilt only after a mutation; repeated displays between edits
+        # reuse the cached string.
+        if self._str_cache is None:
+            # The phone dict is keyed by the digit strings, so joining the
+            # keys skips the per-Phone .value loads entirely.
+            self._str_cache = (
+                f"Contact name: {self.name}, "
+                f"phones: {'; '.join(self.phones)}, "
+                f"birthday: {self.birthday.text if self.birthday else 'No birthday'}"
+            )
+        return self._str_cache
+
+class AddressBook(dict):
+    def __init__(self, capacity=0):
+        super().__init__()
+        if capacity:
+            # Same pre-sizing trick as _presized_dict, applied in place.
+            for key in range(capacity):
+                self[key] = None
+            for key in range(capacity):
+                del self[key]
+        # Flat, sorted (keys, records) index so the upcoming-birthday scan
+        # walks plain int lists instead of chasing record attributes.
+        self._bday_keys = []
+        self._bday_records = []
+        self._bday_keys_np = None
+        self._bday_index_dirty = False
+
+    def add_record(self, record):
+        # Interned keys make the dict's equality checks pointer compares
+        # for names that are looked up repeatedly from the CLI.
+        self[sys.intern(record.name)] = record
+        record._book = self
+        # Unconditional: inserting may also replace a same-name record
+        # whose birthday is still sitting in the index.
+        self._bday_index_dirty = True
+
+    def find(self, name):
+        return self.get(sys.intern(name), None)
+
+    def delete(self, name):
+        if self.pop(name, None) is not None:
+            self._bday_index_dirty = True
+
+    def _rebuild_bday_index(self):
+        pairs = sorted(
+            ((record.birthday.md_key, record) for record in self.values()
+             if record.birthday),
+            key=lambda pair: pair[0],
+        )
+        self._bday_keys = [key for key, _ in pairs]
+        self._bday_records = [record for _, record in pairs]
+        if _np is not None:
+            self._bday_keys_np = _np.asarray(self._bday_keys, dtype=_np.int16)
+        self._bday_index_dirty = False
+
+    def get_upcoming_birthdays(self, days):
+        if self._bday_index_dirty:
+            self._rebuild_bday_index()
+        if days < 0:
+            # A negative window would otherwise look like a year wrap and
+            # match nearly every record.
+            return []
+        if days >= 365:
+            # The (month, day) keys cannot express a window of a year or
+            # more; every birthday falls inside it anyway.
+            return list(self._bday_records)
+        today = date.today()
+        end_date = today + timedelta(days=days)
+        today_key = today.month * 32 + today.day
+        end_key = end_date.month * 32 + end_date.day
+        keys = self._bday_keys
+        records = self._bday_records
+        if _njit is not None and self._bday_keys_np is not None:
+            hits = _scan_bday_keys(self._bday_keys_np, today_key, end_key,
+                                   end_key < today_key)
+            return [records[i] for i in hits]
+        if end_key >= today_key:
+            lo = bisect_left(keys, today_key)
+            hi = bisect_right(keys, end_key)
+            return records[lo:hi]
+        # The window wraps past New Year, so it covers two key ranges.
+        lo = bisect_left(keys, today_key)
+        hi = bisect_right(keys, end_key)
+        return records[lo:] + records[:hi]